@@ -2,6 +2,8 @@
 Core functions wrapping kyschooldata R package via rpy2.
 """
 
+import functools
+
 import pandas as pd
 from rpy2 import robjects
 from rpy2.robjects import pandas2ri
@@ -110,6 +112,9 @@ def get_available_years() -> dict:
     """
     Get the range of available years for enrollment data.
 
+    The range is fixed for an installed version of the R package, so the
+    R lookup is cached after the first call.
+
     Returns
     -------
     dict
@@ -121,6 +126,13 @@ def get_available_years() -> dict:
     >>> years = ky.get_available_years()
     >>> print(f"Data available from {years['min_year']} to {years['max_year']}")
     """
+    # Copy so callers cannot mutate the cached result.
+    return dict(_fetch_available_years())
+
+
+@functools.lru_cache(maxsize=1)
+def _fetch_available_years() -> dict:
+    """Query the R package for the available year range."""
     pkg = _get_pkg()
     with localconverter(robjects.default_converter + pandas2ri.converter):
         r_result = pkg.get_available_years()
@@ -0,0 +1,178 @@
+"""
+Shared pytest fixtures for pykyschooldata tests.
+
+Every call into the wrapper round-trips through R, so fetched data is
+computed once per test session and shared across test classes.
+
+The suite runs serially in CI. It can also be run with pytest-xdist
+(e.g. -n 4 --dist loadscope), where each worker has its own session and
+its own embedded R. In that case fetches are serialized across workers
+with a file lock: the R package's on-disk cache (see R/cache.R) is
+written with a plain saveRDS, so concurrent workers would otherwise all
+miss it, download the same year, and could read a half-written file.
+
+Fetched frames are also written as parquet under .pytest_cache, so a
+fresh pytest run starts from local disk. Files are keyed on the Python
+and R package versions and expire after CACHE_MAX_AGE_DAYS, matching the
+R cache. Pass --fresh-fetch to ignore them and refetch from R. A few
+smoke tests call the wrapper directly so the rpy2 conversion stays
+under test.
+"""
+
+import contextlib
+import os
+import socket
+import time
+import warnings
+
+import pandas as pd
+import pytest
+
+# Low-cardinality string columns stored as categoricals so filters compare
+# integer codes instead of Python strings.
+CATEGORY_COLUMNS = ("subgroup", "grade_level", "district_name")
+
+# Host every enrollment download comes from (see R/get_raw_enrollment.R).
+KDE_HOST = "www.education.ky.gov"
+
+# Same default as max_age in the R package's cache_exists().
+CACHE_MAX_AGE_DAYS = 30
+
+# Failures that only mean the parquet copy is unusable: no parquet engine,
+# an unreadable or unwritable file, or data pyarrow cannot store.
+try:
+    from pyarrow import ArrowException
+except ImportError:
+    _PARQUET_ERRORS = (ImportError, OSError)
+else:
+    _PARQUET_ERRORS = (ImportError, OSError, ArrowException)
+
+
+def _categorize(df):
+    """Convert repeated string columns to the pandas category dtype."""
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fresh-fetch",
+        action="store_true",
+        default=False,
+        help="Ignore enrollment data cached in .pytest_cache and refetch from R.",
+    )
+
+
+def _cache_is_fresh(path):
+    """True if path exists and is younger than CACHE_MAX_AGE_DAYS."""
+    if not path.exists():
+        return False
+    age_days = (time.time() - path.stat().st_mtime) / 86400
+    return age_days < CACHE_MAX_AGE_DAYS
+
+
+def _cached_fetch(request, lock, name, fetch):
+    """Return fetch(), persisted as parquet in the pytest cache directory."""
+    path = request.config.cache.mkdir("pykyschooldata") / f"{name}.parquet"
+    with lock:
+        if _cache_is_fresh(path) and not request.config.getoption("--fresh-fetch"):
+            try:
+                return pd.read_parquet(path)
+            except _PARQUET_ERRORS as exc:
+                warnings.warn(f"Ignoring unreadable cache {path.name}: {exc}")
+
+        df = fetch()
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+        except _PARQUET_ERRORS as exc:
+            warnings.warn(f"Could not write cache {path.name}: {exc}")
+            tmp_path.unlink(missing_ok=True)
+        return df
+
+
+@pytest.fixture(scope="session")
+def fetch_lock(tmp_path_factory):
+    """File lock shared by all xdist workers in a run, held while fetching.
+
+    A no-op outside xdist, or when filelock is not installed.
+    """
+    if "PYTEST_XDIST_WORKER" not in os.environ:
+        return contextlib.nullcontext()
+    try:
+        from filelock import FileLock
+    except ImportError:
+        return contextlib.nullcontext()
+    root_tmp_dir = tmp_path_factory.getbasetemp().parent
+    return FileLock(str(root_tmp_dir / "pykyschooldata-fetch.lock"))
+
+
+@pytest.fixture(scope="session")
+def cache_version():
+    """Python and R package versions, used to key the parquet cache."""
+    import pykyschooldata as ky
+    from rpy2 import robjects
+    r_version = robjects.r(
+        'as.character(utils::packageVersion("kyschooldata"))'
+    )[0]
+    return f"py{ky.__version__}_r{r_version}"
+
+
+@pytest.fixture(scope="session")
+def kde_online():
+    """Skip data tests when KDE is unreachable, like skip_if_offline() in R."""
+    try:
+        socket.create_connection((KDE_HOST, 443), timeout=5).close()
+    except OSError:
+        pytest.skip(f"{KDE_HOST} is unreachable")
+
+
+@pytest.fixture(scope="session")
+def available_years():
+    """Available year range, fetched once per session."""
+    import pykyschooldata as ky
+    return ky.get_available_years()
+
+
+@pytest.fixture(scope="session")
+def enr_max_year(request, kde_online, fetch_lock, cache_version,
+                 available_years):
+    """Enrollment data for the most recent available year."""
+    import pykyschooldata as ky
+    end_year = available_years["max_year"]
+    return _cached_fetch(
+        request, fetch_lock, f"enr_{end_year}_{cache_version}",
+        lambda: ky.fetch_enr(end_year),
+    )
+
+
+@pytest.fixture(scope="module")
+def df_2024(request, kde_online, fetch_lock, cache_version, available_years):
+    """Enrollment data for 2024, with categorical string columns.
+
+    Copies enr_max_year when 2024 is the latest available year, so each
+    module gets its own frame without another fetch and enr_max_year
+    keeps the dtypes fetch_enr returned.
+    """
+    if available_years["max_year"] == 2024:
+        return _categorize(request.getfixturevalue("enr_max_year").copy())
+    import pykyschooldata as ky
+    df = _cached_fetch(
+        request, fetch_lock, f"enr_2024_{cache_version}",
+        lambda: ky.fetch_enr(2024),
+    )
+    return _categorize(df)
+
+
+@pytest.fixture(scope="session")
+def multi_df(request, kde_online, fetch_lock, cache_version):
+    """Enrollment data for 2020-2024, fetched in one call and sliced by tests."""
+    import pykyschooldata as ky
+    years = [2020, 2021, 2022, 2023, 2024]
+    return _cached_fetch(
+        request, fetch_lock, f"enr_multi_2020_2024_{cache_version}",
+        lambda: ky.fetch_enr_multi(years),
+    )
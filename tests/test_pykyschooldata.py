@@ -1,35 +1,162 @@
 """
 Tests for pykyschooldata Python wrapper.
 
-Minimal smoke tests - the actual data logic is tested by R testthat.
-These just verify the Python wrapper imports and exposes expected functions.
+The detailed data logic is tested by R testthat. These verify the Python
+wrapper imports, exposes the expected functions, and returns sane data.
+Fetched data is shared through the fixtures in conftest.py.
 """
 
+import os
+
+import pandas as pd
 import pytest
 
+# rpy2 raises OSError/RuntimeError rather than ImportError when it cannot
+# find or load R. Skip the module locally in that case, but fail in CI,
+# where R and the wrapper are always installed.
+try:
+    import pykyschooldata as ky
+except (ImportError, OSError, RuntimeError) as exc:
+    if os.environ.get("CI"):
+        raise
+    pytest.skip(f"pykyschooldata unavailable: {exc}", allow_module_level=True)
+
+
+class TestImport:
+    """Package imports and exposes the expected API."""
+
+    def test_import_package(self):
+        """Package imports successfully."""
+        import pykyschooldata
+        assert pykyschooldata is ky
+
+    def test_has_fetch_enr(self):
+        """fetch_enr function is available."""
+        assert hasattr(ky, 'fetch_enr')
+        assert callable(ky.fetch_enr)
+
+    def test_has_fetch_enr_multi(self):
+        """fetch_enr_multi function is available."""
+        assert hasattr(ky, 'fetch_enr_multi')
+        assert callable(ky.fetch_enr_multi)
+
+    def test_has_get_available_years(self):
+        """get_available_years function is available."""
+        assert hasattr(ky, 'get_available_years')
+        assert callable(ky.get_available_years)
+
+    def test_has_version(self):
+        """Package has a version string."""
+        assert hasattr(ky, '__version__')
+        assert isinstance(ky.__version__, str)
+
+
+class TestGetAvailableYears:
+    """Tests for get_available_years()."""
+
+    def test_returns_min_and_max(self, available_years):
+        """Result has min_year and max_year keys."""
+        assert "min_year" in available_years
+        assert "max_year" in available_years
+
+    def test_range_is_ordered(self, available_years):
+        """min_year is not after max_year."""
+        assert available_years["min_year"] <= available_years["max_year"]
+
+    def test_r_lookup_is_cached(self):
+        """Repeat calls reuse the cached R lookup."""
+        lookup = ky.core._fetch_available_years
+        ky.get_available_years()
+        hits = lookup.cache_info().hits
+        ky.get_available_years()
+        assert lookup.cache_info().hits == hits + 1
+        assert lookup.cache_info().misses <= 1
+
+    def test_returns_independent_copies(self):
+        """Repeat calls return independent copies of the cached dict."""
+        years = ky.get_available_years()
+        assert isinstance(years, dict)
+        years["max_year"] = 0
+        assert ky.get_available_years()["max_year"] != 0
+
+
+class TestFetchEnr:
+    """Tests for fetch_enr() on the most recent year."""
+
+    def test_returns_dataframe(self, kde_online, fetch_lock, available_years):
+        """fetch_enr returns a non-empty pandas DataFrame."""
+        with fetch_lock:
+            df = ky.fetch_enr(available_years["max_year"])
+        assert isinstance(df, pd.DataFrame)
+        assert len(df) > 0
+
+    def test_has_expected_columns(self, enr_max_year):
+        """Tidy output has the standard identifier and count columns."""
+        df = enr_max_year
+        for col in ["end_year", "district_name", "subgroup",
+                    "grade_level", "n_students", "is_state", "is_district"]:
+            assert col in df.columns, f"Missing column: {col}"
+
+    def test_end_year_matches_request(self, enr_max_year, available_years):
+        """Every row belongs to the requested year."""
+        ey = enr_max_year["end_year"]
+        assert ey.min() == ey.max() == available_years["max_year"]
+
+
+class TestFetchEnrMulti:
+    """Tests for fetch_enr_multi()."""
+
+    def test_returns_dataframe(self, kde_online, fetch_lock):
+        """fetch_enr_multi returns a non-empty pandas DataFrame."""
+        with fetch_lock:
+            df = ky.fetch_enr_multi([2023, 2024])
+        assert isinstance(df, pd.DataFrame)
+        assert len(df) > 0
+
+    def test_contains_all_requested_years(self, multi_df):
+        """Combined data covers every requested year."""
+        years = [2022, 2023, 2024]
+        df = multi_df[multi_df["end_year"].isin(years)]
+        years_in_data = set(df["end_year"].unique().tolist())
+        missing = set(years) - years_in_data
+        assert not missing, f"Missing years: {missing}"
+
+    def test_consecutive_years(self, multi_df):
+        """Consecutive SRC-era years are all present."""
+        df = multi_df[multi_df["end_year"].isin([2020, 2021, 2022])]
+        assert sorted(df["end_year"].unique()) == [2020, 2021, 2022]
 
-def test_import_package():
-    """Package imports successfully."""
-    import pykyschooldata
-    assert pykyschooldata is not None
+    def test_multi_year_has_more_rows(self, multi_df, df_2024):
+        """Two years of data have more rows than one."""
+        df = multi_df[multi_df["end_year"].isin([2023, 2024])]
+        assert len(df) > len(df_2024)
 
 
-def test_has_fetch_enr():
-    """fetch_enr function is available."""
-    import pykyschooldata
-    assert hasattr(pykyschooldata, 'fetch_enr')
-    assert callable(pykyschooldata.fetch_enr)
+class TestDataIntegrity:
+    """Sanity checks on 2024 enrollment values."""
 
+    def test_state_enrollment_reasonable(self, df_2024):
+        """Kentucky statewide total is in a plausible range."""
+        df = df_2024
+        state_total = df.query(
+            "is_state and subgroup == 'total_enrollment' and grade_level == 'TOTAL'"
+        )
+        assert len(state_total) == 1
+        total = state_total["n_students"].iat[0]
+        assert 500_000 < total < 800_000, f"State total {total} out of range"
 
-def test_has_get_available_years():
-    """get_available_years function is available."""
-    import pykyschooldata
-    assert hasattr(pykyschooldata, 'get_available_years')
-    assert callable(pykyschooldata.get_available_years)
+    def test_district_count_reasonable(self, df_2024):
+        """Kentucky has roughly 170 school districts."""
+        df = df_2024
+        n_districts = df.loc[df["is_district"], "district_name"].nunique()
+        assert 150 < n_districts < 200, f"Found {n_districts} districts"
 
+    def test_enrollment_values_positive(self, df_2024):
+        """No negative enrollment counts."""
+        assert not (df_2024["n_students"] < 0).any(), "Found negative enrollment values"
 
-def test_has_version():
-    """Package has a version string."""
-    import pykyschooldata
-    assert hasattr(pykyschooldata, '__version__')
-    assert isinstance(pykyschooldata.__version__, str)
+    def test_no_duplicate_state_totals(self, df_2024):
+        """Each subgroup/grade appears once at the state level."""
+        df = df_2024
+        state = df.loc[df["is_state"]]
+        assert not state.duplicated(["subgroup", "grade_level"]).any()